@@ -21,12 +21,13 @@ def create_perturb_files(in_path, in_files, out_path, copy_all_files=False):
     ]
 
     if copy_all_files:
-        all_files = os.listdir(path)
         # disregard the input files which are copied above
-        other_files = [f for f in all_files if f not in in_files]
-        # copy all other files
-        for f in other_files:
-            shutil.copy("{}/{}".format(in_path, f), out_path)
+        skip = set(in_files)
+        # copy all other files, the directory entries already carry the full path
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name not in skip:
+                    shutil.copy(entry.path, out_path)
 
     return data
 
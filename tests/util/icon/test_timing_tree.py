@@ -68,6 +68,26 @@ class TestTimingTree(unittest.TestCase):
             )
             self.assertIsNotNone(tt.root, msg="did not properly initialize tree")
 
+    def test_read_timing_crlf(self):
+        for timing_file in (timing_file_1, timing_file_3):
+            crlf_file = os.path.join(self.test_path, os.path.basename(timing_file))
+            with open(timing_file, "rb") as f_in, open(crlf_file, "wb") as f_out:
+                f_out.write(f_in.read().replace(b"\n", b"\r\n"))
+
+            lf_data, lf_meta_data = read_logfile(timing_file)
+            crlf_data, crlf_meta_data = read_logfile(crlf_file)
+
+            self.assertDictEqual(
+                lf_meta_data,
+                crlf_meta_data,
+                msg="CRLF meta data does not match for {}".format(timing_file),
+            )
+            self.assertListEqual(
+                lf_data,
+                crlf_data,
+                msg="CRLF timing tables do not match for {}".format(timing_file),
+            )
+
     def test_json_load(self):
         tt_json = TimingTree.from_json(json_reference)
         tt = TimingTree.from_logfile(timing_file_1, read_logfile)
@@ -0,0 +1,34 @@
+import unittest
+
+from util.utils import first_last_idx_of, unique_elements
+
+
+class TestUtils(unittest.TestCase):
+    def test_unique_elements(self):
+        revs = ["c", "a", "c", "b", "a"]
+
+        self.assertListEqual(
+            unique_elements(revs),
+            ["c", "a", "b"],
+            msg="unique elements are not in first-seen order",
+        )
+
+    def test_first_last_idx_of(self):
+        revs = ["a", "b", "a", "c", "b", "b", "a"]
+
+        first_last = first_last_idx_of(revs)
+
+        self.assertDictEqual(
+            first_last,
+            {"a": (0, 6), "b": (1, 5), "c": (3, 3)},
+            msg="first and last indices do not match",
+        )
+        self.assertListEqual(
+            list(first_last),
+            unique_elements(revs),
+            msg="elements are not in first-seen order",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,14 @@
 import re
 import sys
-from datetime import datetime
-
-import numpy as np
 
 from util.constants import datetime_format
 from util.log_handler import logger
+from util.utils import parse_datetime
 
 timing_start_regex = r"(?: +L? ?[a-zA-Z_.]+)"
 timing_element_regex = r"(?:\[?\d+[.msh]?\d*s?\]? +)"
 timing_regex = timing_start_regex + " +" + timing_element_regex + "{6,20} *(?!.)"
-header_regex = r"name +.*calls.*"
-indent_regex = r"^ *L? "
+header_regex = r"^ *name +.*calls"
 hour_regex = r"(\d+)h(\d+)m(\d+)s"
 minute_regex = r"(\d+[.]?\d*)m(\d+[.]?\d*)s"
 sec_regex = r"(\d+[.]?\d*)s"
@@ -28,6 +25,17 @@ icon_date_formats = ("%a %b %d %H:%M:%S %Z %Y", "%a %d %b %Y %H:%M:%S %p %Z")
 
 dict_regex = "({} *:) *(.*)"
 
+# compile the patterns once, they are applied to every line of the log
+timing_re = re.compile(timing_regex)
+header_re = re.compile(header_regex)
+hour_re = re.compile(hour_regex)
+minute_re = re.compile(minute_regex)
+sec_re = re.compile(sec_regex)
+number_re = re.compile(number_regex)
+dateline_res = tuple(re.compile(r) for r in dateline_regexs)
+revision_re = re.compile(dict_regex.format("Revision"))
+branch_re = re.compile(dict_regex.format("Branch"))
+
 
 def _convert_dateline_to_start_end_datetime(dateline, icon_date_format):
     # LOG.check files have more dates than we need
@@ -37,104 +45,139 @@ def _convert_dateline_to_start_end_datetime(dateline, icon_date_format):
         dateline = [dateline[1], dateline[2]]
     start_time, finish_time = dateline
 
-    finish_datetime = datetime.strptime(finish_time, icon_date_format)
+    finish_datetime = parse_datetime(finish_time, icon_date_format)
     finish_datetime_converted = finish_datetime.strftime(datetime_format)
 
-    start_datetime = datetime.strptime(start_time, icon_date_format)
+    start_datetime = parse_datetime(start_time, icon_date_format)
     start_datetime_converted = start_datetime.strftime(datetime_format)
 
     return (start_datetime_converted, finish_datetime_converted)
 
 
-def read_logfile(filename):
-    with open(filename, "r", encoding="latin-1") as f:
-        # read file into list of lines, remove empty lines
-        full_file = f.read()
-        data = [e for e in full_file.split("\n") if e != ""]
-
-        # filter by timing headers and elements
-        data = [
-            e for e in data if re.search(header_regex, e) or re.search(timing_regex, e)
-        ]
-
-        # store line numbers of timing table headers
-        header_lines = [i for i, e in enumerate(data) if re.search(header_regex, e)]
-
-        # initialize storage for all tables
-        timing_data = []
-
-        # construct timing tables
-        for k, i_header in enumerate(header_lines):
-            # make sure stay within header_line bounds
-            i_end = header_lines[k + 1] if k + 1 < len(header_lines) else -1
-
-            # get data from this table (starting one line after header)
-            table = data[i_header + 1 : i_end]
-
-            # parse table header
-            header_elements = [
-                e.lstrip().rstrip()
-                for e in data[i_header].split("  ")
-                if e not in ["", " "]
-            ]
-            timing_data_k = {e: [] for e in header_elements}
-
-            # parse table elements
-            timing_data_k["indent"] = []
-            timing_data_k["name"] = []
-
-            for table_line in table:
-                elements = [
-                    e.replace("[", "").replace("]", "")
-                    for e in table_line.split(" ")
-                    if e not in ["", "L"]
-                ]
-                if len(elements) != len(header_elements):
-                    logger.critical(
-                        (
-                            "Number of header elements ({}) "
-                            + "does not match number of table elements ({})"
-                        ).format(len(header_elements), len(elements))
-                    )
-                    logger.critical("header: {}".format(" -- ".join(header_elements)))
-                    logger.critical("table : {}".format(" -- ".join(elements)))
-                    sys.exit(1)
-                # find indentation level for each table line
-                first = re.search(indent_regex, table_line).group(0)
-                # assume 1 indent is 3 white spaces
-                timing_data_k["indent"].append(len(first) // 3)
-
-                timing_data_k["name"].append(elements[0])
-                for i in np.arange(1, len(elements)):
-                    timing_data_k[header_elements[i]].append(parse_time(elements[i]))
-            # We are not interested in the small wrt_output table
-            if len(timing_data_k["indent"]) > 5:
-                timing_data.append(timing_data_k)
-        # start parsing meta data from log
-        meta_data = {}
-
-        # get start and finish time from job
-        found_dateline_yes = False
-        for dateline_regex, icon_date_format in zip(dateline_regexs, icon_date_formats):
-            dateline = re.findall(dateline_regex, full_file)
-
-            if dateline:
+def _is_header(line):
+    # cheap substring check first, only candidate lines go through the regex
+    return "calls" in line and header_re.search(line) is not None
+
+
+def _is_timing(line):
+    # every timing element is followed by blanks, so a table line ends with one
+    return line.endswith(" ") and timing_re.search(line) is not None
+
+
+def _iter_logfile(filename, bufsize=1 << 20):
+    # universal newlines, like the baseline read(): "\r\n" and "\r" become "\n"
+    with open(filename, "r", encoding="latin-1", buffering=bufsize) as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def _parse_table(header, table):
+    # parse table header
+    header_elements = [
+        e.lstrip().rstrip() for e in header.split("  ") if e not in ["", " "]
+    ]
+    timing_data_k = {e: [] for e in header_elements}
+
+    # parse table elements
+    timing_data_k["indent"] = []
+    timing_data_k["name"] = []
+    # bind the column appends once per table instead of looking them up per row
+    append_indent = timing_data_k["indent"].append
+    append_name = timing_data_k["name"].append
+    append_values = [timing_data_k[e].append for e in header_elements[1:]]
+
+    for table_line in table:
+        # split() collapses runs of white space and never yields empty strings,
+        # brackets (around ranks) only ever enclose a whole element
+        elements = [e.strip("[]") for e in table_line.split() if e != "L"]
+        if len(elements) != len(header_elements):
+            logger.critical(
                 (
-                    start_datetime_converted,
-                    finish_datetime_converted,
-                ) = _convert_dateline_to_start_end_datetime(dateline, icon_date_format)
-                found_dateline_yes = True
-        if not found_dateline_yes:
-            raise Exception("Could not match any regex for start and end time.")
-        meta_data["start_time"] = start_datetime_converted
-        meta_data["finish_time"] = finish_datetime_converted
-
-        # get meta data from ICON log (in the form "Key : Value")
-        revision = re.search(dict_regex.format("Revision"), full_file)
-        branch = re.search(dict_regex.format("Branch"), full_file)
-
-        meta_data["revision"] = revision.group(2)
-        meta_data["branch"] = branch.group(2)
+                    "Number of header elements ({}) "
+                    + "does not match number of table elements ({})"
+                ).format(len(header_elements), len(elements))
+            )
+            logger.critical("header: {}".format(" -- ".join(header_elements)))
+            logger.critical("table : {}".format(" -- ".join(elements)))
+            sys.exit(1)
+        # find indentation level for each table line: the leading blanks
+        # plus an optional "L " marker
+        stripped = table_line.lstrip(" ")
+        first = len(table_line) - len(stripped)
+        if stripped.startswith("L "):
+            first += 2
+        # assume 1 indent is 3 white spaces
+        append_indent(first // 3)
+
+        append_name(elements[0])
+        for append_value, element in zip(append_values, elements[1:]):
+            append_value(parse_time(element))
+    return timing_data_k
+
+
+def _add_table(timing_data, header, table):
+    # We are not interested in the small wrt_output table, skip it unparsed
+    if header is not None and len(table) > 5:
+        timing_data.append(_parse_table(header, table))
+
+
+def read_logfile(filename):
+    # parsed timing tables, each one is parsed as soon as it is complete
+    timing_data = []
+    # header and lines of the table currently being read
+    header = None
+    table = []
+    # dates matched by each of the dateline regexs
+    datelines = tuple([] for _ in dateline_res)
+    revision = None
+    branch = None
+
+    # stream the log line by line in a single pass: split the timing lines into
+    # tables and pick up the meta data on the way (no pattern spans multiple lines)
+    for line in _iter_logfile(filename):
+        if line == "":
+            continue
+        if _is_header(line):
+            _add_table(timing_data, header, table)
+            header, table = line, []
+        elif header is not None and _is_timing(line):
+            table.append(line)
+        # all datelines contain the year and a clock time, most lines never
+        # reach the regexs
+        if " 20" in line and ":" in line:
+            for dateline, dateline_re in zip(datelines, dateline_res):
+                # only the first three dates are ever used
+                if len(dateline) < 3:
+                    dateline.extend(m.group(0) for m in dateline_re.finditer(line))
+        # get meta data from ICON log (in the form "Key : Value"), the key is a
+        # literal so only lines containing it need to go through the regex
+        if revision is None and "Revision" in line:
+            revision = revision_re.search(line)
+        if branch is None and "Branch" in line:
+            branch = branch_re.search(line)
+
+    # the last table ends one line before the last timing line of the log
+    _add_table(timing_data, header, table[:-1])
+
+    # start parsing meta data from log
+    meta_data = {}
+
+    # get start and finish time from job
+    found_dateline_yes = False
+    for dateline, icon_date_format in zip(datelines, icon_date_formats):
+        if dateline:
+            (
+                start_datetime_converted,
+                finish_datetime_converted,
+            ) = _convert_dateline_to_start_end_datetime(dateline, icon_date_format)
+            found_dateline_yes = True
+    if not found_dateline_yes:
+        raise Exception("Could not match any regex for start and end time.")
+    meta_data["start_time"] = start_datetime_converted
+    meta_data["finish_time"] = finish_datetime_converted
+
+    meta_data["revision"] = revision.group(2)
+    meta_data["branch"] = branch.group(2)
     meta_data["n_tables"] = len(timing_data)
     meta_data["entries"] = [len(e["indent"]) for e in timing_data]
 
@@ -142,10 +185,12 @@ def read_logfile(filename):
 
 
 def parse_time(time_string):
-    m1 = re.match(hour_regex, time_string)
-    m2 = re.match(minute_regex, time_string)
-    m3 = re.match(sec_regex, time_string)
-    m4 = re.match(number_regex, time_string)
+    # only match until one format fits, and skip the hour and minute formats
+    # unless their unit appears (most entries are plain seconds or numbers)
+    m1 = hour_re.match(time_string) if "h" in time_string else None
+    m2 = minute_re.match(time_string) if not m1 and "m" in time_string else None
+    m3 = sec_re.match(time_string) if not (m1 or m2) else None
+    m4 = number_re.match(time_string) if not (m1 or m2 or m3) else None
     if m1:
         h, m, s = [m1.group(i) for i in [1, 2, 3]]
     elif m2:
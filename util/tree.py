@@ -163,7 +163,6 @@ class TimingTree:
         ]
 
         # traverse the tree
-        matrix = np.zeros((n, len(column_index)))
         for i in range(n):
             last = root
             ancestry = [last.get_name()]
@@ -174,13 +173,12 @@ class TimingTree:
             node = TimingNode(timing_data["name"][i], ancestry=ancestry)
             last.add_child(node)
 
-            matrix[i, :] = [
-                val[i]
-                for key, val in timing_data.items()
-                if key not in ["indent", "name"]
-            ]
+        # timing_data is already stored column-wise, hand the columns to pandas
+        columns = {
+            key: np.asarray(timing_data[key], dtype=float) for key in column_index
+        }
 
-        return root, pd.DataFrame(matrix, index=row_index, columns=column_index)
+        return root, pd.DataFrame(columns, index=row_index, columns=column_index)
 
     @staticmethod
     def input_exists(filename):
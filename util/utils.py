@@ -1,21 +1,22 @@
 import hashlib
 import re
+from datetime import datetime
+from functools import lru_cache
 
-
-def unique_elements(inlist):
-    unique = []
-    for element in inlist:
-        if element not in unique:
-            unique.append(element)
-    return unique
+digits_re = re.compile(r"\d+")
 
 
-def first_idx_of(list, element):
-    return list.index(element)
+def unique_elements(inlist):
+    # dict keys keep the insertion order and make the membership test O(1)
+    return list(dict.fromkeys(inlist))
 
 
-def last_idx_of(list, element):
-    return len(list) - list[::-1].index(element) - 1
+def first_last_idx_of(inlist):
+    "map each unique element to its (first, last) index in a single pass"
+    first_last = {}
+    for i, element in enumerate(inlist):
+        first_last[element] = (first_last.get(element, (i,))[0], i)
+    return first_last
 
 
 def generate_seed_from_member_id(member_id, use_64_bits=True):
@@ -35,4 +36,10 @@ def generate_seed_from_member_id(member_id, use_64_bits=True):
 
 def numbers(s):
     "join all numbers from a string and return as an int (base 10)"
-    return int("".join(re.findall(r"\d+", s)))
+    return int("".join(digits_re.findall(s)))
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(date_string, date_format):
+    "memoized datetime.strptime, the same date strings get parsed over and over"
+    return datetime.strptime(date_string, date_format)
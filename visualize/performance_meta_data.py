@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 
 import click
@@ -10,7 +10,7 @@ from util.click_util import CommaSeperatedStrings, cli_help
 from util.constants import datetime_format
 from util.log_handler import logger
 from util.tree import TimingTree
-from util.utils import unique_elements
+from util.utils import parse_datetime, unique_elements
 
 
 def plot_meta_data_timer(timer, data, revs, ax, experiment_name, savedir):
@@ -74,7 +74,8 @@ def performance_meta_data(
     dates = tt.meta_data["finish_time"]
     if isinstance(dates, str):
         dates = [dates]
-    dates = sorted([datetime.strptime(s, datetime_format) for s in dates])
+    # only the latest date is needed, no need to sort them all
+    last_measurement = max(parse_datetime(s, datetime_format) for s in dates)
 
     # create dataframe for revisions and align to tt.data
     index = tt.data[i_table].index
@@ -83,14 +84,13 @@ def performance_meta_data(
         df.loc[(slice(None), time), :] = tt.meta_data["revision"][i]
 
     # include history from last 20 weeks
-    last_measurement = dates[-1]
     week = timedelta(days=7)
     day = timedelta(days=1)
     reftime = last_measurement + day - week * 20
     seltime = [
         t
         for t in tt.meta_data["finish_time"]
-        if datetime.strptime(t, datetime_format) > reftime
+        if parse_datetime(t, datetime_format) > reftime
     ]
     data = pd.concat(
         [
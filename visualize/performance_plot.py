@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import click
 import matplotlib
@@ -9,21 +9,20 @@ from util.click_util import CommaSeperatedStrings, cli_help
 from util.constants import datetime_format
 from util.log_handler import logger
 from util.tree import TimingTree
-from util.utils import first_idx_of, last_idx_of, unique_elements
+from util.utils import first_last_idx_of, parse_datetime
 
 
 def colour_revs(times, revs, ax):
-    urevs = unique_elements(revs)
     srevs = [r[:8] for r in revs]
-    first_last = [(first_idx_of(revs, r), last_idx_of(revs, r)) for r in urevs]
+    first_last = first_last_idx_of(revs).values()
     ntot = len(times)
 
     i = 0
     for f, l in first_last:
         c = "gray" if i % 2 == 0 else "white"
-        t0 = matplotlib.dates.date2num(datetime.strptime(times[f], datetime_format))
+        t0 = matplotlib.dates.date2num(parse_datetime(times[f], datetime_format))
         t1 = matplotlib.dates.date2num(
-            datetime.strptime(times[min(ntot - 1, l + 1)], datetime_format)
+            parse_datetime(times[min(ntot - 1, l + 1)], datetime_format)
         )
 
         r = srevs[f]
@@ -64,7 +63,7 @@ def performance_plot(timing_database, savedir, timing_names, experiment_name, i_
     if isinstance(dates, str):
         dates = [dates]
 
-    dates = sorted([datetime.strptime(s, datetime_format) for s in dates])
+    dates = sorted([parse_datetime(s, datetime_format) for s in dates])
     x = matplotlib.dates.date2num(dates)
 
     last_measurement = dates[-1]
@@ -4,12 +4,14 @@ import sys
 file_path = sys.argv[1]
 builder = sys.argv[2]
 
-regex = '.*{0}.*configureflags="(?P<flags>.*?)"'.format(builder)
+regex = re.compile(
+    '.*{0}.*configureflags="(?P<flags>.*?)"'.format(builder), re.IGNORECASE
+)
 
 with open(file_path) as f:
-    data = f.read()
+    # the pattern cannot span lines, so search the file line by line
+    m = next((m for m in map(regex.search, f) if m), None)
     try:
-        m = re.search(regex, data, re.IGNORECASE).groupdict()
-        print(m["flags"])
+        print(m.groupdict()["flags"])
     except AttributeError:
         print("ERROR: did not find configure flags for {}".format(builder))